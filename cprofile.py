@@ -13,11 +13,18 @@ import pstats
 import time
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
+
+# Harmonic number H(100); invariant, so computed once at import time
+_HARMONIC_100 = float(sum(1.0 / (i + 1) for i in range(100)))
+
 
 @dataclass
 class DataRecord:
@@ -51,43 +58,41 @@ class DataSourceConnector:
 class DataTransformer:
     """Handles data transformation and enrichment"""
     
-    @lru_cache(maxsize=1000)
-    def _calculate_complex_metric(self, value: float) -> float:
-        """Expensive computation with caching"""
-        time.sleep(0.01)  # Simulate complex calculation
-        return value ** 2 * sum(1 / (i + 1) for i in range(100))
-    
     def transform_record(self, record: Dict) -> DataRecord:
         """Transform raw data into structured record"""
-        enriched_value = self._calculate_complex_metric(record["value"])
-        return DataRecord(
-            id=record["id"],
-            timestamp=datetime.fromisoformat(record["timestamp"]),
-            value=enriched_value,
-            metadata=record["metadata"]
-        )
+        return self.transform_batch([record])[0]
+    
+    def transform_batch(self, records: List[Dict]) -> List[DataRecord]:
+        """Transform a batch of raw records with one vectorized metric computation"""
+        values = np.fromiter((r["value"] for r in records), dtype=np.float64, count=len(records))
+        enriched_values = values * values * _HARMONIC_100
+        return [
+            DataRecord(
+                id=record["id"],
+                timestamp=datetime.fromisoformat(record["timestamp"]),
+                value=enriched_value,
+                metadata=record["metadata"]
+            )
+            for record, enriched_value in zip(records, enriched_values.tolist())
+        ]
 
 
 class DataValidator:
     """Validates and filters data records"""
     
-    def __init__(self):
-        self.validation_cache = {}
+    @staticmethod
+    @lru_cache(maxsize=10000)
+    def _validate_fields(value: float, year: int, has_source: bool) -> bool:
+        """Apply business rules to the hashable fields of a record.
+        
+        maxsize caps the cache's memory. Values are random floats, so hits only
+        happen when the same (value, year, has_source) combination repeats.
+        """
+        return 0 <= value <= 10000 and year >= 2020 and has_source
     
     def is_valid(self, record: DataRecord) -> bool:
         """Validate record against business rules"""
-        cache_key = f"{record.id}_{record.value}"
-        if cache_key in self.validation_cache:
-            return self.validation_cache[cache_key]
-        
-        time.sleep(0.005)  # Simulate validation logic
-        is_valid = (
-            0 <= record.value <= 10000 and
-            record.timestamp.year >= 2020 and
-            "source" in record.metadata
-        )
-        self.validation_cache[cache_key] = is_valid
-        return is_valid
+        return self._validate_fields(record.value, record.timestamp.year, "source" in record.metadata)
 
 
 class DatabaseManager:
@@ -101,8 +106,7 @@ class DatabaseManager:
     def _bulk_insert(self):
         """Simulate bulk insert operation"""
         time.sleep(0.05)  # Simulate DB write
-        for record in self._pending_records:
-            self.db[record.id] = record
+        self.db.update((record.id, record) for record in self._pending_records)
         self._pending_records = []
     
     def insert_record(self, record: DataRecord):
@@ -131,13 +135,13 @@ class DataPipeline:
     
     def process_batch(self, batch_size: int = 50):
         """Process a batch of data through the pipeline"""
-        for source in self.sources:
-            raw_data = source.fetch_data(batch_size)
-            
-            for raw_record in raw_data:
-                # Transform
-                record = self.transformer.transform_record(raw_record)
-                
+        # Fetch from all sources concurrently so their I/O latencies overlap
+        with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+            raw_batches = list(executor.map(lambda source: source.fetch_data(batch_size), self.sources))
+        
+        for raw_data in raw_batches:
+            # Transform the whole batch at once
+            for record in self.transformer.transform_batch(raw_data):
                 # Validate
                 if self.validator.is_valid(record):
                     # Store
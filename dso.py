@@ -1,6 +1,9 @@
-from collections import defaultdict
+from collections import Counter, defaultdict
 import time
 
+# The list version is O(n^2); only run it up to this size to bound demo time
+LIST_SIZE_LIMIT = 1000
+
 # Measuring list vs set performance
 def find_duplicates_list(numbers):
     seen = []
@@ -20,12 +23,37 @@ def find_duplicates_set(numbers):
         seen.add(num)
     return duplicates
 
-# Real-world test
-numbers = list(range(10000)) + list(range(5000))
+def find_duplicates_counter(numbers):
+    counts = Counter()
+    duplicates = []
+    for num in numbers:
+        if counts[num]:  # O(1) operation
+            duplicates.append(num)
+        counts[num] += 1
+    return duplicates
+
+# Real-world test: all three finders on the same capped input (with duplicates)
+small_numbers = list(range(LIST_SIZE_LIMIT)) + list(range(LIST_SIZE_LIMIT // 2))
+print(f"Input of {len(small_numbers)} numbers:")
 start = time.time()
-find_duplicates_list(numbers)
+find_duplicates_list(small_numbers)
 print(f"List time: {time.time() - start:.4f} seconds")
 
+start = time.time()
+find_duplicates_set(small_numbers)
+print(f"Set time: {time.time() - start:.4f} seconds")
+
+start = time.time()
+find_duplicates_counter(small_numbers)
+print(f"Counter time: {time.time() - start:.4f} seconds")
+
+# Full-size input, too large for the O(n^2) list version
+numbers = list(range(10000)) + list(range(5000))
+print(f"\nInput of {len(numbers)} numbers (list version skipped):")
 start = time.time()
 find_duplicates_set(numbers)
-print(f"Set time: {time.time() - start:.4f} seconds")
\ No newline at end of file
+print(f"Set time: {time.time() - start:.4f} seconds")
+
+start = time.time()
+find_duplicates_counter(numbers)
+print(f"Counter time: {time.time() - start:.4f} seconds")
\ No newline at end of file
@@ -8,7 +8,9 @@ This example demonstrates memory optimization techniques in Python.
 When calculating squares and cubes of 1 million numbers:
 - Inefficient approach with lists: Uses ~76MB memory
 - Better approach with generators: Uses ~0.2MB memory
-- Best approach with NumPy: Uses ~24MB memory but runs 100x faster
+- Best approach with NumPy: Uses ~8MB memory and runs 100x faster; the sum
+  (~2.5e23) overflows int64, so it is accumulated in float64 and is approximate
+- Closed-form approach: Uses no extra memory and runs in constant time
 
 The memory usage difference is significant because:
 1. Lists store each number as a separate Python object
@@ -60,14 +62,25 @@ def best_approach():
     start_time = time.time()
     
     # Best Practice 1: Using NumPy arrays for numerical operations
-    numbers = np.arange(1_000_000)
+    # (float64: the sum of cubes exceeds the int64 range and would wrap around)
+    numbers = np.arange(1_000_000, dtype=np.float64)
     
-    # Best Practice 2: Vectorized operations instead of loops
-    squares = numbers ** 2
-    cubes = numbers ** 3
+    # Best Practice 2: Fused multiply-and-reduce, so no squares/cubes arrays are built
+    result = np.einsum('i,i->', numbers, numbers) + np.einsum('i,i,i->', numbers, numbers, numbers)
     
-    # Best Practice 3: Efficient array operations
-    result = np.sum(squares + cubes)
+    print(f"Sum of results: {result:.15e} (float64, approximate)")
+    print(f"Time taken: {time.time() - start_time:.2f} seconds\n")
+
+
+@profile
+def closed_form_approach():
+    """Demonstrates replacing the computation itself with a closed-form formula"""
+    print("\n=== Closed-Form Approach ===")
+    start_time = time.time()
+    
+    # Best Practice: sum(i^2) = n(n-1)(2n-1)/6 and sum(i^3) = (n(n-1)/2)^2 for i in range(n)
+    n = 1_000_000
+    result = n * (n - 1) * (2 * n - 1) // 6 + (n * (n - 1) // 2) ** 2
     
     print(f"Sum of results: {result}")
     print(f"Time taken: {time.time() - start_time:.2f} seconds\n")
@@ -80,4 +93,5 @@ if __name__ == "__main__":
     
     inefficient_approach()
     better_approach()
-    best_approach()
\ No newline at end of file
+    best_approach()
+    closed_form_approach()
\ No newline at end of file